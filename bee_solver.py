@@ -25,16 +25,31 @@ Output:
     - The number of pangrams found.
 """
 
+import mmap
+import os
+import pickle
 import string
 import sys
 from argparse import Action, ArgumentParser, ArgumentTypeError, Namespace
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-from InquirerPy.resolver import prompt
-from num2words import num2words
+import numpy as np
 
 # Constants
-ALPHABET = set(string.ascii_lowercase)
 FILE_PATH = "nyt.txt"
+CACHE_PATH = f"{FILE_PATH}.masks"
+CACHE_VERSION = 6
+MIN_LENGTH = 4
+LETTER_BITS = {char: 1 << i for i, char in enumerate(string.ascii_lowercase)}
+INVALID_BIT = 1 << len(LETTER_BITS)
+BYTE_BITS = [LETTER_BITS.get(chr(byte), INVALID_BIT) for byte in range(256)]
+LOWERCASE = bytes.maketrans(
+    string.ascii_uppercase.encode("ascii"), string.ascii_lowercase.encode("ascii")
+)
+MASK_BITS = 0xFFFFFFFF
+WORDS_PER_WORKER = 1 << 20
+ORDINALS = ("first", "second", "third", "fourth", "fifth", "sixth")
 
 
 def validate_char(char: str) -> bool:
@@ -62,6 +77,40 @@ def check_duplicate(char: str, letters: list[str]) -> bool:
     return validate_char(char) and char not in letters
 
 
+def get_mask(letters: str | list[str]) -> int:
+    """Build the letter-set bitmask of a word or a collection of letters.
+
+    Each lowercase letter maps to its own bit, so two words share a mask exactly
+    when they use the same set of letters. Any non-alphabetical character sets
+    INVALID_BIT, which no set of puzzle letters can contain.
+
+    Args:
+        letters (str | list[str]): The word or letters to encode.
+
+    Returns:
+        int: The bitmask of the letters.
+    """
+    mask = 0
+    for char in letters:
+        mask |= LETTER_BITS.get(char, INVALID_BIT)
+    return mask
+
+
+def get_word_mask(word: bytes) -> int:
+    """Build the letter-set bitmask of an ASCII-encoded word.
+
+    Args:
+        word (bytes): The word to encode.
+
+    Returns:
+        int: The bitmask of the word, as computed by get_mask.
+    """
+    mask = 0
+    for byte in word:
+        mask |= BYTE_BITS[byte]
+    return mask
+
+
 def get_center(letters: list[str] | None) -> str:
     """Get the center letter from the user.
 
@@ -71,6 +120,9 @@ def get_center(letters: list[str] | None) -> str:
     Returns:
         str: The center letter input by the user.
     """
+    # Imported lazily so runs that never prompt skip loading InquirerPy.
+    from InquirerPy.resolver import prompt
+
     validate = (
         validate_char
         if letters is None
@@ -108,8 +160,11 @@ def get_letters(center: str, old_letters: list[str]) -> list[str]:
         list[str]: The final list of outer letters.
     """
     letters = [center] if old_letters is None else [center] + old_letters
+    if len(letters) < 7:
+        # Imported lazily so runs that never prompt skip loading InquirerPy.
+        from InquirerPy.resolver import prompt
     while len(letters) < 7:
-        nth = num2words(len(letters), to="ordinal")
+        nth = ORDINALS[len(letters) - 1]
         letter_prompt_settings = [
             {
                 "name": "letter",
@@ -129,58 +184,255 @@ def get_letters(center: str, old_letters: list[str]) -> list[str]:
     return letters
 
 
-def get_words() -> list[str]:
+def load_cache(mtime: int) -> tuple[bytes, np.ndarray, np.ndarray] | None:
+    """Load the cached words and bitmasks if they match the word file.
+
+    Args:
+        mtime (int): The modification time of the word file in nanoseconds.
+
+    Returns:
+        tuple[bytes, np.ndarray, np.ndarray] | None: The cached word blob, word
+            offsets and bitmasks, or None if the cache is missing, unreadable, or
+            stale.
+    """
+    try:
+        with open(CACHE_PATH, "rb") as file:
+            version, cache_mtime, blob, offsets, masks = pickle.load(file)
+        if version != CACHE_VERSION or cache_mtime != mtime:
+            return None
+        if not all(isinstance(x, bytes) for x in (blob, offsets, masks)):
+            return None
+        offsets = np.frombuffer(offsets, dtype=np.uint32)
+        masks = np.frombuffer(masks, dtype=np.uint32)
+    except Exception:
+        # The cache is disposable, so any damaged or foreign file is a miss.
+        return None
+    if offsets.size != masks.size + 1:
+        return None
+    return blob, offsets, masks
+
+
+def save_cache(mtime: int, blob: bytes, offsets: np.ndarray, masks: np.ndarray) -> None:
+    """Save the words and bitmasks next to the word file for later runs.
+
+    The cache is written to a temporary file and moved into place, so a concurrent
+    run never reads a partly written cache. Failing to write the cache is not an
+    error, the next run simply rebuilds it.
+
+    Args:
+        mtime (int): The modification time of the word file in nanoseconds.
+        blob (bytes): The newline-separated words.
+        offsets (np.ndarray): The offset of each word in the blob.
+        masks (np.ndarray): The bitmask of each word.
+
+    Returns:
+        None
+    """
+    temp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            payload = (CACHE_VERSION, mtime, blob, offsets.tobytes(), masks.tobytes())
+            pickle.dump(payload, file, protocol=5)
+        os.replace(temp_path, CACHE_PATH)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def is_word(word: bytes) -> bool:
+    """Check if a dictionary entry can be a Spelling Bee answer.
+
+    Args:
+        word (bytes): The lowercase dictionary entry to check.
+
+    Returns:
+        bool: True if the entry is long enough and only contains ASCII letters,
+            False otherwise.
+    """
+    return len(word) >= MIN_LENGTH and word.isalpha()
+
+
+def read_entries() -> list[bytes]:
+    """Read the lowercase entries of the word file.
+
+    The file is memory-mapped and lowercased line by line as bytes, so the whole
+    file is never copied into a single str.
+
+    Returns:
+        list[bytes]: The stripped, lowercase entries that can be answers.
+    """
+    with open(FILE_PATH, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            entries = (
+                line.strip().translate(LOWERCASE) for line in iter(mapped.readline, b"")
+            )
+            return [entry for entry in entries if is_word(entry)]
+
+
+@lru_cache(maxsize=1)
+def load_words(mtime: int) -> tuple[bytes, np.ndarray, np.ndarray]:
+    """Load the words and their bitmasks for a given version of the word file.
+
+    The words are deduplicated and sorted once here, so any subset of them taken in
+    index order is already sorted. They are stored as a single newline-separated
+    ASCII blob, with word i spanning offsets[i] to offsets[i + 1] - 1, so only the
+    matched words ever become Python strings. Results are memoized on the
+    modification time, so repeated calls in the same process skip I/O until the
+    word file changes.
+
+    Args:
+        mtime (int): The modification time of the word file in nanoseconds.
+
+    Returns:
+        tuple[bytes, np.ndarray, np.ndarray]: The word blob, the offset of each word
+            in it, and the parallel array of their letter-set bitmasks.
+    """
+    cache = load_cache(mtime)
+    if cache is not None:
+        return cache
+    words = sorted(dict.fromkeys(read_entries()))
+    blob = b"\n".join(words)
+    offsets = np.zeros(len(words) + 1, dtype=np.uint32)
+    np.cumsum([len(word) + 1 for word in words], out=offsets[1:])
+    masks = np.fromiter(map(get_word_mask, words), dtype=np.uint32, count=len(words))
+    save_cache(mtime, blob, offsets, masks)
+    return blob, offsets, masks
+
+
+def get_words() -> tuple[bytes, np.ndarray, np.ndarray]:
     """Retrieve the list of words from the NYT word file.
 
+    Entries that cannot be answers or are duplicates are dropped at load time, and
+    the letter-set bitmasks are cached in CACHE_PATH and only rebuilt when the word
+    file changes.
+
     Returns:
-        list[str]: The list of words.
+        tuple[bytes, np.ndarray, np.ndarray]: The newline-separated word blob, the
+            offset of each word in it, and the parallel array of their letter-set
+            bitmasks.
     """
     try:
-        with open(FILE_PATH, encoding="utf-8") as file:
-            return [x.lower() for x in file.read().splitlines()[2:]]
+        return load_words(os.stat(FILE_PATH).st_mtime_ns)
     except FileNotFoundError:
         print(f"Error: File {FILE_PATH} not found.")
         sys.exit(1)
 
 
+def scan(
+    masks: np.ndarray, acceptable_mask: int, center_mask: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the indices of all valid words and pangrams from their bitmasks.
+
+    Args:
+        masks (np.ndarray): The letter-set bitmask of each word.
+        acceptable_mask (int): The bitmask of the acceptable letters.
+        center_mask (int): The bitmask of the center letter.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: A tuple containing the indices of the valid
+            words and the indices of the pangrams among them.
+    """
+    unacceptable_mask = np.uint32(~acceptable_mask & MASK_BITS)
+    # Only a small fraction of words avoid every unacceptable letter, while many
+    # contain the center letter, so test the more selective condition first and
+    # check the center letter on the survivors only.
+    valid = np.flatnonzero((masks & unacceptable_mask) == 0)
+    valid = valid[(masks[valid] & np.uint32(center_mask)) != 0]
+    pangrams = valid[masks[valid] == acceptable_mask]
+    return valid, pangrams
+
+
+def parallel_scan(
+    masks: np.ndarray, acceptable_mask: int, center_mask: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run scan over contiguous chunks of the bitmasks on a thread pool.
+
+    NumPy releases the GIL for the bitwise operations, so the chunks are scanned
+    concurrently. One worker is used per WORDS_PER_WORKER bitmasks, up to the CPU
+    count, and the bitmasks are scanned directly when that comes to a single worker.
+
+    Args:
+        masks (np.ndarray): The letter-set bitmask of each word.
+        acceptable_mask (int): The bitmask of the acceptable letters.
+        center_mask (int): The bitmask of the center letter.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: A tuple containing the indices of the valid
+            words and the indices of the pangrams among them.
+    """
+    workers = min(os.cpu_count() or 1, masks.size // WORDS_PER_WORKER)
+    if workers <= 1:
+        return scan(masks, acceptable_mask, center_mask)
+    bounds = np.linspace(0, masks.size, workers + 1, dtype=np.intp).tolist()
+
+    def scan_chunk(start: int, stop: int) -> tuple[np.ndarray, np.ndarray]:
+        valid, pangrams = scan(masks[start:stop], acceptable_mask, center_mask)
+        return valid + start, pangrams + start
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(scan_chunk, bounds[:-1], bounds[1:]))
+    valid, pangrams = zip(*results)
+    return np.concatenate(valid), np.concatenate(pangrams)
+
+
+def get_slices(blob: bytes, offsets: np.ndarray, indices: np.ndarray) -> list[bytes]:
+    """Slice the words at the given indices out of the word blob.
+
+    Args:
+        blob (bytes): The newline-separated words.
+        offsets (np.ndarray): The offset of each word in the blob.
+        indices (np.ndarray): The indices of the words to slice.
+
+    Returns:
+        list[bytes]: The ASCII-encoded words, in the order of the indices.
+    """
+    starts = offsets[indices].tolist()
+    ends = (offsets[indices + 1] - 1).tolist()
+    return [blob[start:end] for start, end in zip(starts, ends)]
+
+
 def solver(
-    word_list: list[str], acceptable: list[str], center: str
-) -> tuple[list[str], int]:
+    blob: bytes,
+    offsets: np.ndarray,
+    masks: np.ndarray,
+    acceptable: list[str],
+    center: str,
+) -> tuple[list[bytes], set[bytes]]:
     """Find all valid words and pangrams in the word list.
 
+    Words stay ASCII-encoded bytes here and are only decoded when printed.
+
     Args:
-        word_list (list[str]): The list of words to check.
+        blob (bytes): The sorted, deduplicated, newline-separated words to check.
+        offsets (np.ndarray): The offset of each word in the blob.
+        masks (np.ndarray): The letter-set bitmask of each word in the blob.
         acceptable (list[str]): The list of acceptable letters.
         center (str): The center letter.
 
     Returns:
-        tuple[list[str], int]: A tuple containing the list of valid words and the number
-            of pangrams found.
+        tuple[list[bytes], set[bytes]]: A tuple containing the sorted list of valid
+            words and the set of pangrams among them, all in lowercase.
     """
-    words = set()
-    num_pan = 0
-    unacceptable = ALPHABET - set(acceptable)
-    for word in word_list:
-        if center in word and not any(el in unacceptable for el in word):
-            if all(el in word for el in acceptable):
-                words.add(word.upper())
-                num_pan += 1
-            else:
-                words.add(word)
-    return sorted(words, key=str.casefold), num_pan
-
-
-def print_results(words: list[str], num_pan: int) -> None:
-    """Print the results of the word search.
+    valid, pangrams = parallel_scan(masks, get_mask(acceptable), get_mask(center))
+    return get_slices(blob, offsets, valid), set(get_slices(blob, offsets, pangrams))
+
+
+def print_results(words: list[bytes], pangrams: set[bytes]) -> None:
+    """Print the results of the word search, with pangrams in uppercase.
 
     Args:
-        words (list[str]): The list of words found in the word search.
-        num_pan (int): The number of pangrams found in the word search.
+        words (list[bytes]): The list of words found in the word search.
+        pangrams (set[bytes]): The set of pangrams found in the word search.
 
     Returns:
         None
     """
     num_words = len(words)
+    num_pan = len(pangrams)
     if num_words == 0:
         print("No words were found.")
     else:
@@ -193,7 +445,8 @@ def print_results(words: list[str], num_pan: int) -> None:
         ess = "s" if num_words != 1 else ""
         print(f"{num_words} word{ess}{pan_str} {verb} found:")
         for word in words:
-            print(f"\t{word}")
+            text = word.decode("ascii")
+            print(f"\t{text.upper() if word in pangrams else text}")
 
 
 def check_letter(value: str) -> str:
@@ -309,9 +562,9 @@ def main() -> None:
     if not center:
         center = get_center(letters)
     acceptable = get_letters(center, letters)
-    word_list = get_words()
-    words, num_pan = solver(word_list, acceptable, center)
-    print_results(words, num_pan)
+    blob, offsets, masks = get_words()
+    words, pangrams = solver(blob, offsets, masks, acceptable, center)
+    print_results(words, pangrams)
 
 
 if __name__ == "__main__":